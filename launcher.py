@@ -30,8 +30,10 @@ def main():
         ("customtkinter", "customtkinter", True),
         ("PIL", "Pillow", True),
         ("openpyxl", "openpyxl", False),
+        ("lxml", "lxml", False),
         ("reportlab", "reportlab", False),
         ("tkinterdnd2", "tkinterdnd2", False),
+        ("orjson", "orjson", False),
     ]
 
     missing_required = []
@@ -6,29 +6,77 @@ RepoPrompt-inspired glassmorphism design with semi-transparent effects
 """
 
 import customtkinter as ctk
-from tkinter import filedialog, messagebox, scrolledtext
+from tkinter import filedialog, messagebox
 import tkinter as tk
 from PIL import Image, ImageTk, ImageFilter, ImageDraw
 import os
+import io
 import json
 from datetime import datetime
 from pathlib import Path
 import tempfile
-import uuid
+import itertools
+import hashlib
+import struct
 import platform
 import sys
-import glob
 import re
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, Counter
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("light")  # Light mode only
 ctk.set_default_color_theme("blue")  # Themes: "blue", "green", "dark-blue"
 
+# Resampling filter for export downscales. BICUBIC is visually indistinguishable
+# from LANCZOS at report sizes but much cheaper; override with REPAIR_RESAMPLE.
+# getattr keeps this working on Pillow-SIMD builds that lack some filter names.
+RESAMPLE_FILTER = getattr(
+    Image.Resampling,
+    os.environ.get("REPAIR_RESAMPLE", "BICUBIC").upper(),
+    Image.Resampling.BICUBIC
+)
+
+# File extensions accepted from drag-and-drop
+IMAGE_EXTS = frozenset(('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'))
+
+# Dotfiles (.DS_Store, ._ AppleDouble siblings) and Office/Samba lock files
+HIDDEN_FILE_PREFIXES = ('.', '~$')
+
+# Fallback tokenizer for drag-and-drop data: {braced}, "quoted", 'quoted' or bare paths
+DND_SPLIT_RE = re.compile(r"""\{[^}]*\}|"[^"]*"|'[^']*'|\S+""")
+
+# Edge length of gallery thumbnails in pixels
+THUMBNAIL_SIZE = 250
+THUMBNAIL_MAX_INFLIGHT = 8  # cap on gallery thumbnail decodes queued at once
+
+# Sidebar item cards created per event loop turn when filling a long list
+ITEM_CARD_BATCH = 40
+
+# Formats offered in the file dialogs; passing these to Image.open skips
+# probing every other registered PIL plugin
+IMAGE_FORMATS = ('JPEG', 'PNG', 'WEBP', 'BMP', 'GIF', 'TIFF')
+
+# JPEG quality for images embedded in PDFs; override with REPAIR_JPEG_Q
+PDF_JPEG_QUALITY = int(os.environ.get("REPAIR_JPEG_Q", "85"))
+
+# Downscaled PDF images are cached on disk and reused by later exports
+PDF_IMAGE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "repair_report_cache")
+PDF_IMAGE_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+# Gallery thumbnails are mirrored to disk so reopening a project skips decoding
+THUMBNAIL_CACHE_DIR = os.path.join(tempfile.gettempdir(), "repair_report_thumbs")
+THUMBNAIL_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
 # Excel export
 try:
     import openpyxl
     from openpyxl.drawing import image as xl_image
-    from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+    from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
     EXCEL_AVAILABLE = True
 except ImportError:
     EXCEL_AVAILABLE = False
@@ -43,6 +91,20 @@ try:
     from reportlab.lib.enums import TA_CENTER
     from reportlab.pdfbase import pdfmetrics
     from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+    from reportlab import rl_config
+    rl_config.shapeChecking = 0  # Skip per-attribute validation on flowables
+
+    # Shared table styles for image layouts, parsed once
+    PDF_CENTER_STYLE = TableStyle([('ALIGN', (0,0), (-1,-1), 'CENTER')])
+    PDF_IMAGE_GRID_STYLE = TableStyle([
+        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+        ('LEFTPADDING', (0,0), (-1,-1), 5),
+        ('RIGHTPADDING', (0,0), (-1,-1), 5),
+        ('TOPPADDING', (0,0), (-1,-1), 5),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 5),
+    ])
     PDF_AVAILABLE = True
 except ImportError:
     PDF_AVAILABLE = False
@@ -56,6 +118,13 @@ try:
 except ImportError:
     pass
 
+# Faster project save/load
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ModernRepairTool(ctk.CTk):
     """Modern repair report tool with glassmorphism UI"""
@@ -79,10 +148,62 @@ class ModernRepairTool(ctk.CTk):
         self.current_item_id = 0
         self.selected_item_index = None
         self.max_images_per_row = 1
+        # Kept in step with every image add/remove via _image_count_changed
+        self._total_image_count = 0
+        self._image_count_hist = Counter()  # images per item -> number of items
 
         # Caches
         self.image_cache = {}
-        self.thumbnail_cache = {}
+        self.thumbnail_cache = OrderedDict()  # (path, mtime_ns, size) -> PhotoImage, LRU order
+        self.max_thumbnail_cache = 256
+        self._thumbnail_keys = {}  # path -> its current thumbnail_cache key
+        self.pdf_image_sizes = {}  # cached PDF image path -> pixel size
+        self.image_info_cache = {}  # (path, mtime_ns) -> (width, height, bytes)
+
+        # Sidebar card widgets by position, with the state each last rendered
+        self._item_cards = []
+        self._card_fill_after_id = None  # pending _fill_item_cards batch
+
+        # Coalesced redraw state for _request_redraw
+        self._redraw_pending = False
+        self._redraw_cards = set()
+        self._redraw_gallery = None
+
+        # Debounced description edit: timer id and the item it belongs to
+        self._desc_after_id = None
+        self._desc_pending_index = None
+
+        # Unique suffixes for temp files written during exports
+        self._tmp_counter = itertools.count()
+
+        # Set when the window closes so export workers stop processing images
+        self._export_stop = threading.Event()
+        self._export_running = False  # Only one export at a time
+
+        # Thumbnail decoding pool; PIL releases the GIL while decoding
+        self._thumb_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+        self._thumb_pool.submit(self._prune_image_cache, THUMBNAIL_CACHE_DIR, THUMBNAIL_CACHE_MAX_BYTES)
+
+        # PDF font, registered once (in the background at startup)
+        self._pdf_font_name = None
+        self._pdf_font_lock = threading.Lock()
+        if PDF_AVAILABLE:
+            self._thumb_pool.submit(self._setup_chinese_fonts)
+
+        # Gallery thumbnails are decoded lazily as their cards scroll into view.
+        # Results come back through a queue and are drained on the Tk thread;
+        # the generation counter drops results for a gallery that was cleared.
+        self._gallery_generation = 0
+        self._pending_thumbs = {}   # thumbnail key -> [(card, label)] not yet submitted
+        self._decoding_thumbs = {}  # thumbnail key -> [(card, label)] being decoded
+        self._thumb_futures = set()  # submitted decodes, cancelled when the gallery clears
+        self._thumb_inflight = 0
+        self._thumb_results = queue.Queue()
+        self._thumb_polling = False
+        self._visible_check_pending = False
+
+        # Gallery card widgets, reused across display_item_images calls
+        self._image_slots = []
 
         # Debug logs
         self.debug_logs = []
@@ -109,6 +230,14 @@ class ModernRepairTool(ctk.CTk):
         self.setup_ui()
         self.setup_drag_drop()
         self.bind_shortcuts()  # Add keyboard shortcuts
+        self.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+    def on_closing(self):
+        """Stop background image work and close the window"""
+        # Pools join their queued jobs at interpreter exit; drop them instead
+        self._export_stop.set()
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
 
     def setup_ui(self):
         """Setup the modern UI layout"""
@@ -440,6 +569,15 @@ class ModernRepairTool(ctk.CTk):
         for i in range(4):
             self.image_gallery.grid_columnconfigure(i, weight=1)
 
+        # Check for newly visible thumbnails whenever the gallery scrolls or resizes
+        gallery_scroll_set = self.image_gallery._scrollbar.set
+
+        def on_gallery_scroll(first, last):
+            gallery_scroll_set(first, last)
+            self._schedule_visible_thumbnails()
+
+        self.image_gallery._parent_canvas.configure(yscrollcommand=on_gallery_scroll)
+
         # Drop zone indicator
         self.drop_zone = ctk.CTkFrame(
             self.image_gallery,
@@ -660,9 +798,9 @@ class ModernRepairTool(ctk.CTk):
             files = self._split_dnd_paths(raw_data)
             self._log_debug(f"📄 解析到 {len(files)} 个文件路径")
 
-            # Filter for image files
-            exts = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp')
-            image_files = [fp for fp in files if os.path.exists(fp) and fp.lower().endswith(exts)]
+            # Filter for image files, probing each distinct path once
+            image_files = [fp for fp in dict.fromkeys(files)
+                           if os.path.splitext(fp)[1].lower() in IMAGE_EXTS and self._validate_image_file(fp)]
             self._log_debug(f"🖼️ 筛选到 {len(image_files)} 个有效图片文件")
 
             if not image_files:
@@ -675,11 +813,14 @@ class ModernRepairTool(ctk.CTk):
                 # Add to current selected item
                 if self.selected_item_index is not None and 0 <= self.selected_item_index < len(self.items):
                     img_path = image_files[0]
-                    if img_path not in self.items[self.selected_item_index]['images']:
-                        self.items[self.selected_item_index]['images'].append(img_path)
-                        self.refresh_item_list()
-                        self.display_item_images(self.selected_item_index)
-                        self.update_stats()
+                    item = self.items[self.selected_item_index]
+                    image_set = self._image_set(item)
+                    if img_path not in image_set:
+                        images = item['images']
+                        images.append(img_path)
+                        image_set.add(img_path)
+                        self._image_count_changed(len(images) - 1, len(images))
+                        self._request_redraw(self.selected_item_index, gallery=self.selected_item_index)
                         self.set_status(f"✓ 已添加图片到项目 {self.selected_item_index + 1}")
                         self._log_debug(f"✅ 成功添加图片到项目 {self.selected_item_index + 1}")
                     else:
@@ -690,10 +831,12 @@ class ModernRepairTool(ctk.CTk):
                     if messagebox.askyesno("提示", "当前没有选中项目\n是否创建新项目并添加图片？"):
                         self.add_item()
                         if self.selected_item_index is not None:
-                            self.items[self.selected_item_index]['images'].append(image_files[0])
-                            self.refresh_item_list()
-                            self.display_item_images(self.selected_item_index)
-                            self.update_stats()
+                            item = self.items[self.selected_item_index]
+                            images = item['images']
+                            images.append(image_files[0])
+                            self._image_set(item).add(image_files[0])
+                            self._image_count_changed(len(images) - 1, len(images))
+                            self._request_redraw(self.selected_item_index, gallery=self.selected_item_index)
             else:
                 # Multiple images, show batch assign dialog
                 self.show_batch_assign_dialog(image_files)
@@ -712,15 +855,30 @@ class ModernRepairTool(ctk.CTk):
         except Exception:
             # Fallback: manual parsing for paths with spaces
             # Handles formats like: {path1} {path2} or "path1" "path2"
-            candidates = re.findall(r'\{([^}]*)\}|"([^"]*)"|\'([^\']*)\'|([^ \t\r\n]+)', raw or "")
             cleaned = []
-            for groups in candidates:
-                # groups is a tuple of matched groups, find the non-empty one
-                path = next((g for g in groups if g), None)
+            for m in DND_SPLIT_RE.finditer(raw or ""):
+                path = m.group(0)
+                if path[0] + path[-1] in ('{}', '""', "''"):
+                    path = path[1:-1]
+                path = path.strip()
                 if path:
-                    cleaned.append(path.strip())
+                    cleaned.append(path)
             return cleaned
 
+    def _validate_image_file(self, fp):
+        """Check that a file exists and starts with a known image signature
+
+        Only the first 12 bytes are read; nothing is decoded.
+        """
+        try:
+            with open(fp, 'rb') as f:
+                head = f.read(12)
+        except OSError:
+            return False
+        return (head.startswith((b'\xff\xd8\xff', b'\x89PNG\r\n\x1a\n', b'GIF87a', b'GIF89a',
+                                 b'BM', b'II*\x00', b'MM\x00*'))
+                or (head[:4] == b'RIFF' and head[8:12] == b'WEBP'))
+
     def add_item(self):
         """Add new repair item"""
         self.current_item_id += 1
@@ -730,10 +888,13 @@ class ModernRepairTool(ctk.CTk):
             'images': []
         }
         self.items.append(new_item)
+        self._image_count_changed(None, 0)
 
-        # Only create the new card instead of refreshing all
+        # Only create the new card instead of refreshing all; if a batched
+        # fill is still running it will reach the new item by itself
         idx = len(self.items) - 1
-        self.create_item_card(idx, new_item)
+        if self._card_fill_after_id is None:
+            self.create_item_card(idx, new_item)
 
         self.update_stats()
         self.set_status(f"✓ 已添加新项目")
@@ -742,19 +903,61 @@ class ModernRepairTool(ctk.CTk):
         self.select_item_optimized(idx)
 
     def refresh_item_list(self):
-        """Refresh the sidebar item list"""
-        # Clear existing items
-        for widget in self.items_scroll.winfo_children():
-            widget.destroy()
+        """Refresh the sidebar item list, only touching cards that changed"""
+        # Drop cards for positions that no longer have an item
+        while len(self._item_cards) > len(self.items):
+            self._item_cards.pop()['card'].destroy()
+
+        # Cards are bound to positions, so existing ones just get new content
+        for idx in range(len(self._item_cards)):
+            self._update_item_card(idx, self.items[idx])
+
+        # Missing cards are created in batches
+        if len(self._item_cards) < len(self.items) and self._card_fill_after_id is None:
+            self._fill_item_cards()
 
-        # Add item cards
-        for idx, item in enumerate(self.items):
-            self.create_item_card(idx, item)
+    def _fill_item_cards(self):
+        """Create missing item cards a batch at a time
+
+        The first batch is built right away; the rest follow in later event
+        loop turns so opening a large project doesn't freeze the window.
+        """
+        self._card_fill_after_id = None
+        end = min(len(self.items), len(self._item_cards) + ITEM_CARD_BATCH)
+        for idx in range(len(self._item_cards), end):
+            self.create_item_card(idx, self.items[idx])
+
+        if len(self._item_cards) < len(self.items):
+            self._card_fill_after_id = self.after(1, self._fill_item_cards)
+
+    def _item_card_state(self, idx, item):
+        """Return the (description, image count, selected) a card should show"""
+        desc_text = item['description'][:30] + "..." if len(item['description']) > 30 else item['description']
+        return desc_text, len(item.get('images', [])), idx == self.selected_item_index
+
+    def _update_item_card(self, idx, item):
+        """Reconfigure the card at idx for item, skipping unchanged parts"""
+        entry = self._item_cards[idx]
+        state = self._item_card_state(idx, item)
+        old_desc, old_count, old_selected = entry['state']
+        desc_text, img_count, is_selected = state
+
+        if desc_text != old_desc:
+            entry['desc_label'].configure(text=desc_text)
+        if img_count != old_count:
+            entry['count_label'].configure(text=f"📷 {img_count} 张图片")
+        if is_selected != old_selected:
+            if is_selected:
+                entry['card'].configure(border_color=self.colors['accent'], border_width=3)
+            else:
+                entry['card'].configure(border_color=self.colors['border'], border_width=2)
+        entry['state'] = state
 
     def create_item_card(self, idx, item):
         """Create a modern card for an item"""
+        desc_text, img_count, is_selected = state = self._item_card_state(idx, item)
+
         # Determine if this card is selected
-        is_selected = (idx == self.selected_item_index)
         border_width = 3 if is_selected else 2
         border_color = self.colors['accent'] if is_selected else self.colors['border']
 
@@ -788,7 +991,6 @@ class ModernRepairTool(ctk.CTk):
         info_frame = ctk.CTkFrame(content, fg_color="transparent")
         info_frame.pack(side="left", fill="x", expand=True)
 
-        desc_text = item['description'][:30] + "..." if len(item['description']) > 30 else item['description']
         desc_label = ctk.CTkLabel(
             info_frame,
             text=desc_text,
@@ -798,7 +1000,6 @@ class ModernRepairTool(ctk.CTk):
         )
         desc_label.pack(anchor="w")
 
-        img_count = len(item.get('images', []))
         count_label = ctk.CTkLabel(
             info_frame,
             text=f"📷 {img_count} 张图片",
@@ -826,6 +1027,13 @@ class ModernRepairTool(ctk.CTk):
         click_handler = lambda e, i=idx: self.select_item_optimized(i)
         self._bind_click_recursive(card, click_handler, exclude=[del_btn])
 
+        self._item_cards.append({
+            'card': card,
+            'desc_label': desc_label,
+            'count_label': count_label,
+            'state': state
+        })
+
     def _bind_click_recursive(self, widget, handler, exclude=None):
         """Recursively bind click event to widget and all children"""
         if exclude is None:
@@ -841,44 +1049,14 @@ class ModernRepairTool(ctk.CTk):
 
     def update_item_card_text(self, idx):
         """Update only the text of a specific item card without rebuilding the entire list"""
-        if idx < 0 or idx >= len(self.items):
-            return
-
-        # Find the card widget in the scrollable frame
-        cards = self.items_scroll.winfo_children()
-        if idx >= len(cards):
-            return
-
-        card = cards[idx]
-        item = self.items[idx]
-
-        # Find and update the description label
-        # The structure is: card -> content -> info_frame -> desc_label
-        try:
-            content = card.winfo_children()[0]  # content frame
-            info_frame = None
-
-            # Find the info_frame (it's the one that's not a label and not a button)
-            for child in content.winfo_children():
-                if isinstance(child, ctk.CTkFrame) and child.cget('fg_color') == 'transparent':
-                    info_frame = child
-                    break
-
-            if info_frame:
-                # Update the description label (first label in info_frame)
-                for child in info_frame.winfo_children():
-                    if isinstance(child, ctk.CTkLabel):
-                        desc_text = item['description'][:30] + "..." if len(item['description']) > 30 else item['description']
-                        child.configure(text=desc_text)
-                        break
-        except Exception as e:
-            # If updating fails, fallback to full refresh
-            print(f"⚠️ 更新卡片文本失败，回退到完整刷新: {e}")
-            self.refresh_item_list()
+        if 0 <= idx < len(self.items) and idx < len(self._item_cards):
+            self._update_item_card(idx, self.items[idx])
 
     def select_item(self, idx):
         """Select an item and display its images"""
+        self._commit_description()
         if 0 <= idx < len(self.items):
+            previous = self.selected_item_index
             self.selected_item_index = idx
             item = self.items[idx]
 
@@ -890,11 +1068,13 @@ class ModernRepairTool(ctk.CTk):
             self.display_item_images(idx)
 
             # Update card highlights
-            self.refresh_item_list()
+            self.refresh_item_cards(previous, idx)
 
     def select_item_optimized(self, idx):
         """Select an item without refreshing all cards (optimized)"""
+        self._commit_description()
         if 0 <= idx < len(self.items):
+            previous = self.selected_item_index
             self.selected_item_index = idx
             item = self.items[idx]
 
@@ -905,23 +1085,26 @@ class ModernRepairTool(ctk.CTk):
             # Display images
             self.display_item_images(idx)
 
-            # Update only the card highlights without rebuilding
-            self.update_card_highlights()
+            # Only the old and new selection change highlight
+            self.refresh_item_cards(previous, idx)
 
-    def update_card_highlights(self):
-        """Update card highlights without rebuilding all cards"""
-        for idx, widget in enumerate(self.items_scroll.winfo_children()):
-            if idx < len(self.items):
-                # Update border color based on selection
-                if idx == self.selected_item_index:
-                    widget.configure(border_color=self.colors['accent'], border_width=3)
-                else:
-                    widget.configure(border_color=self.colors['border'], border_width=2)
+    def refresh_item_cards(self, *indices):
+        """Update item cards in place for single-item edits
+
+        With indices, only those cards are checked; otherwise all of them.
+        Use refresh_item_list when items were added or removed.
+        """
+        count = min(len(self.items), len(self._item_cards))
+        for idx in (indices or range(count)):
+            if idx is not None and 0 <= idx < count:
+                self._update_item_card(idx, self.items[idx])
 
     def delete_item(self, idx):
         """Delete an item"""
+        self._commit_description()
         if 0 <= idx < len(self.items):
             if messagebox.askyesno("确认删除", f"确定要删除项目 {idx + 1} 吗？"):
+                self._image_count_changed(len(self.items[idx].get('images', [])), None)
                 del self.items[idx]
                 self.refresh_item_list()
                 self.update_stats()
@@ -929,12 +1112,29 @@ class ModernRepairTool(ctk.CTk):
                 self.set_status(f"✓ 已删除项目")
 
     def on_description_change(self, event):
-        """Handle description text change"""
-        if self.selected_item_index is not None and 0 <= self.selected_item_index < len(self.items):
+        """Handle description text change, debounced until typing pauses"""
+        if self._desc_after_id is not None:
+            self.after_cancel(self._desc_after_id)
+        self._desc_pending_index = self.selected_item_index
+        self._desc_after_id = self.after(250, self._commit_description)
+
+    def _commit_description(self):
+        """Write a pending description edit to its item
+
+        Called by the debounce timer, and before anything that replaces the
+        entry text, reads descriptions or shifts item indices.
+        """
+        if self._desc_after_id is None:
+            return
+        self.after_cancel(self._desc_after_id)
+        self._desc_after_id = None
+
+        idx = self._desc_pending_index
+        if idx is not None and 0 <= idx < len(self.items):
             new_desc = self.description_entry.get().strip()
-            self.items[self.selected_item_index]['description'] = new_desc if new_desc else f"维修项目 {self.selected_item_index + 1}"
+            self.items[idx]['description'] = new_desc if new_desc else f"维修项目 {idx + 1}"
             # 只更新选中项的卡片文本，不刷新整个列表，避免跳闪
-            self.update_item_card_text(self.selected_item_index)
+            self.update_item_card_text(idx)
 
     def add_images(self):
         """Add images to selected item"""
@@ -952,15 +1152,18 @@ class ModernRepairTool(ctk.CTk):
 
         if file_paths:
             item = self.items[self.selected_item_index]
+            existing = self._image_set(item)
             added = 0
             for path in file_paths:
-                if path not in item['images']:
+                if os.path.basename(path).startswith(HIDDEN_FILE_PREFIXES):
+                    continue
+                if path not in existing and self._validate_image_file(path):
                     item['images'].append(path)
+                    existing.add(path)
                     added += 1
+            self._image_count_changed(len(item['images']) - added, len(item['images']))
 
-            self.refresh_item_list()
-            self.display_item_images(self.selected_item_index)
-            self.update_stats()
+            self._request_redraw(self.selected_item_index, gallery=self.selected_item_index)
             self.set_status(f"✓ 已添加 {added} 张图片")
 
     def batch_add_images(self):
@@ -980,7 +1183,13 @@ class ModernRepairTool(ctk.CTk):
         )
 
         if file_paths:
-            self.show_batch_assign_dialog(list(file_paths))
+            valid_paths = [fp for fp in dict.fromkeys(file_paths)
+                           if not os.path.basename(fp).startswith(HIDDEN_FILE_PREFIXES)
+                           and self._validate_image_file(fp)]
+            if not valid_paths:
+                messagebox.showwarning("提示", "未找到有效的图片文件")
+                return
+            self.show_batch_assign_dialog(valid_paths)
 
     def show_batch_assign_dialog(self, file_paths):
         """Show dialog to assign multiple images to items with full control"""
@@ -1181,12 +1390,18 @@ class ModernRepairTool(ctk.CTk):
             try:
                 succ = skip = err = 0
                 stats = {}
+                touched = set()  # indices of items that received images
                 for fp, v in self.assignments.items():
                     try:
                         pidx = v.get() - 1
                         if 0 <= pidx < len(self.items):
-                            if fp not in self.items[pidx]['images']:
-                                self.items[pidx]['images'].append(fp)
+                            image_set = self._image_set(self.items[pidx])
+                            if fp not in image_set:
+                                images = self.items[pidx]['images']
+                                images.append(fp)
+                                image_set.add(fp)
+                                touched.add(pidx)
+                                self._image_count_changed(len(images) - 1, len(images))
                                 succ += 1
                                 key = f"项目{pidx+1}"
                                 stats[key] = stats.get(key, 0) + 1
@@ -1198,12 +1413,12 @@ class ModernRepairTool(ctk.CTk):
                         err += 1
 
                 dialog.destroy()
-                self.refresh_item_list()
-                self.update_stats()
 
-                # Refresh display if item is selected
-                if self.selected_item_index is not None and 0 <= self.selected_item_index < len(self.items):
-                    self.display_item_images(self.selected_item_index)
+                # Redisplay the gallery only if the selected item received images
+                self._request_redraw(
+                    *touched,
+                    gallery=self.selected_item_index if self.selected_item_index in touched else None
+                )
 
                 if succ:
                     msg = "批量分配完成！\n\n"
@@ -1258,16 +1473,171 @@ class ModernRepairTool(ctk.CTk):
         # Hide drop zone, show images
         self.drop_zone.pack_forget()
 
-        # Display images in grid
+        # Display images in grid, reusing card widgets from earlier displays;
+        # uncached thumbnails start as placeholders
+        while len(self._image_slots) < len(images):
+            self._image_slots.append(self._create_image_slot())
+
         for img_idx, img_path in enumerate(images):
             row = img_idx // 4
             col = img_idx % 4
 
-            img_card = self.create_image_card(img_path, idx)
-            img_card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
+            slot = self._image_slots[img_idx]
+            self._fill_image_slot(slot, img_path, idx)
+            slot['card'].grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
+
+        self._schedule_visible_thumbnails()
+
+    def _schedule_visible_thumbnails(self):
+        """Coalesce visibility checks into one idle callback"""
+        if not self._visible_check_pending:
+            self._visible_check_pending = True
+            self.after_idle(self._load_visible_thumbnails)
+
+    def _load_visible_thumbnails(self):
+        """Submit decodes for placeholder cards in (or near) the visible area"""
+        self._visible_check_pending = False
+
+        if self._pending_thumbs:
+            top, bottom = self.image_gallery._parent_canvas.yview()
+            total_height = self.image_gallery.winfo_height()
+            # Prefetch one row above and below the viewport
+            view_top = top * total_height - THUMBNAIL_SIZE
+            view_bottom = bottom * total_height + THUMBNAIL_SIZE
+            generation = self._gallery_generation
+
+            for key, cards in list(self._pending_thumbs.items()):
+                if self._thumb_inflight >= THUMBNAIL_MAX_INFLIGHT:
+                    break
+                card = cards[0][0]
+                card_y = card.winfo_y()
+                if card_y + card.winfo_height() < view_top or card_y > view_bottom:
+                    continue
+
+                self._decoding_thumbs[key] = self._pending_thumbs.pop(key)
+                self._thumb_inflight += 1
+                future = self._thumb_pool.submit(self._load_thumbnail, key)
+                self._thumb_futures.add(future)
+                future.add_done_callback(
+                    lambda f, k=key, g=generation: self._on_thumbnail_done(f, k, g)
+                )
+
+        if self._thumb_inflight and not self._thumb_polling:
+            self._thumb_polling = True
+            self.after(30, self._poll_thumbnail_results)
+
+    def _on_thumbnail_done(self, future, key, generation):
+        """Hand a finished decode to the Tk thread (runs on any thread)"""
+        # A cancelled decode still reports back so the in-flight count stays right;
+        # it belongs to a cleared gallery, so its generation is already stale
+        if future.cancelled():
+            result = (None, None)
+        elif future.exception() is not None:
+            result = (None, future.exception())
+        else:
+            result = future.result()
+        self._thumb_results.put((generation, key, result, future))
+
+    def _poll_thumbnail_results(self):
+        """Apply decoded thumbnails on the Tk thread and queue more decodes"""
+        try:
+            while True:
+                generation, key, (img, error), future = self._thumb_results.get_nowait()
+                self._thumb_inflight -= 1
+                self._thumb_futures.discard(future)
+                if generation == self._gallery_generation:
+                    self._apply_thumbnail(key, img, error)
+        except queue.Empty:
+            pass
+        finally:
+            # Always re-arm, or one failure would stall every later decode
+            self._thumb_polling = False
+            self._load_visible_thumbnails()
+
+    def _apply_thumbnail(self, key, img, error):
+        """Swap the placeholders waiting on key for its thumbnail"""
+        cards = self._decoding_thumbs.pop(key, [])
+        if error is None:
+            try:
+                photo = ImageTk.PhotoImage(img)
+            except Exception as e:
+                error = e
+                self._log_debug(f"Thumbnail conversion failed for {key[0]}: {e}")
+            else:
+                self._cache_thumbnail(key, photo)
+
+        for card, label in cards:
+            if not label.winfo_exists():
+                continue
+            if error is None:
+                label.configure(image=photo, text="", fg_color="transparent")
+                label.image = photo  # Keep reference
+            else:
+                label.configure(
+                    text=f"无法加载图片\n{str(error)[:30]}",
+                    text_color=self.colors['error']
+                )
+
+    def _load_thumbnail(self, key):
+        """Decode a gallery thumbnail; safe to run on a worker thread
+
+        key is a _thumbnail_key result. The on-disk thumbnail cache is tried
+        first; freshly decoded thumbnails are written back to it.
+        Returns (PIL image, None) on success or (None, exception).
+        """
+        img_path, mtime_ns, size = key
+        cache_path = (self._cache_path(THUMBNAIL_CACHE_DIR, os.path.abspath(img_path), mtime_ns, size)
+                      if mtime_ns is not None else None)
+        if cache_path:
+            try:
+                with Image.open(cache_path, formats=('JPEG',)) as cached:
+                    cached.load()
+                os.utime(cache_path)  # Mark as recently used for eviction
+                return cached, None
+            except Exception:
+                pass
+
+        try:
+            with Image.open(img_path) as img:
+                # Let libjpeg decode at a reduced scale first
+                img.draft('RGB', (size * 2, size * 2))
+                # reducing_gap box-reduces before the final Lanczos pass
+                img.thumbnail((size, size), Image.Resampling.LANCZOS, reducing_gap=2.0)
+                img.load()  # No-op shrinks leave the pixels unread
+        except Exception as e:
+            return None, e
+
+        # Images with transparency are not cached, JPEG would flatten them.
+        # A failed write is logged; the thumbnail is still usable uncached.
+        if cache_path and img.mode in ('RGB', 'L'):
+            self._atomic_write(cache_path, lambda t: img.save(t, 'JPEG', quality=85))
+        return img, None
 
-    def create_image_card(self, img_path, item_idx):
-        """Create a modern card for an image"""
+    def _thumbnail_key(self, img_path):
+        """Return the thumbnail cache key for a path; it changes when the file does"""
+        try:
+            mtime = os.stat(img_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        return (img_path, mtime, THUMBNAIL_SIZE)
+
+    def _cache_thumbnail(self, key, photo):
+        """Store a PhotoImage in the LRU thumbnail cache, evicting the oldest"""
+        # Drop the thumbnail of an older version of the same file
+        old_key = self._thumbnail_keys.get(key[0])
+        if old_key is not None and old_key != key:
+            self.thumbnail_cache.pop(old_key, None)
+        self._thumbnail_keys[key[0]] = key
+
+        self.thumbnail_cache[key] = photo
+        self.thumbnail_cache.move_to_end(key)
+        while len(self.thumbnail_cache) > self.max_thumbnail_cache:
+            evicted, _ = self.thumbnail_cache.popitem(last=False)
+            if self._thumbnail_keys.get(evicted[0]) == evicted:
+                del self._thumbnail_keys[evicted[0]]
+
+    def _create_image_slot(self):
+        """Create a reusable gallery card; _fill_image_slot gives it content"""
         card = ctk.CTkFrame(
             self.image_gallery,
             fg_color=self.colors['bg_secondary'],
@@ -1276,75 +1646,134 @@ class ModernRepairTool(ctk.CTk):
             border_color=self.colors['border']
         )
 
-        try:
-            # Load and display image
-            with Image.open(img_path) as img:
-                # Create thumbnail
-                img.thumbnail((250, 250), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
+        # Image label, sized like a thumbnail so placeholders keep the grid stable
+        img_label = ctk.CTkLabel(
+            card,
+            text="",
+            width=THUMBNAIL_SIZE,
+            height=THUMBNAIL_SIZE,
+            corner_radius=8
+        )
+        img_label.pack(padx=10, pady=10)
 
-                # Image label
-                img_label = ctk.CTkLabel(
-                    card,
-                    text="",
-                    image=photo
-                )
-                img_label.image = photo  # Keep reference
-                img_label.pack(padx=10, pady=10)
+        # Image info
+        info_frame = ctk.CTkFrame(card, fg_color=self.colors['bg_tertiary'])
+        info_frame.pack(fill="x", padx=10, pady=(0, 10))
+
+        name_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=ctk.CTkFont(size=11),
+            text_color=self.colors['text_secondary']
+        )
+        name_label.pack(pady=8)
+
+        # Delete button
+        del_btn = ctk.CTkButton(
+            card,
+            text="删除",
+            height=28,
+            corner_radius=8,
+            fg_color=self.colors['error'],
+            hover_color="#C62828"
+        )
+        del_btn.pack(padx=10, pady=(0, 10))
 
-            # Image info
-            filename = os.path.basename(img_path)
-            if len(filename) > 25:
-                filename = filename[:22] + "..."
+        return {'card': card, 'img_label': img_label, 'name_label': name_label, 'del_btn': del_btn}
 
-            info_frame = ctk.CTkFrame(card, fg_color=self.colors['bg_tertiary'])
-            info_frame.pack(fill="x", padx=10, pady=(0, 10))
+    def _fill_image_slot(self, slot, img_path, item_idx):
+        """Point a gallery card at an image
 
-            ctk.CTkLabel(
-                info_frame,
-                text=filename,
-                font=ctk.CTkFont(size=11),
+        Uses the cached PhotoImage if there is one, otherwise shows a
+        placeholder that _load_visible_thumbnails fills in later.
+        """
+        img_label = slot['img_label']
+        key = self._thumbnail_key(img_path)
+        photo = self.thumbnail_cache.get(key)
+        if photo is not None:
+            self.thumbnail_cache.move_to_end(key)
+            img_label.configure(image=photo, text="", fg_color="transparent")
+            img_label.image = photo  # Keep reference
+        else:
+            # An empty string clears the Tk image; None would leave the old one
+            img_label.configure(
+                image="",
+                text="加载中...",
+                fg_color=self.colors['bg_tertiary'],
                 text_color=self.colors['text_secondary']
-            ).pack(pady=8)
-
-            # Delete button
-            del_btn = ctk.CTkButton(
-                card,
-                text="删除",
-                height=28,
-                corner_radius=8,
-                fg_color=self.colors['error'],
-                hover_color="#C62828",
-                command=lambda: self.delete_image(img_path, item_idx)
             )
-            del_btn.pack(padx=10, pady=(0, 10))
+            img_label.image = None
+            self._pending_thumbs.setdefault(key, []).append((slot['card'], img_label))
 
-        except Exception as e:
-            ctk.CTkLabel(
-                card,
-                text=f"无法加载图片\n{str(e)[:30]}",
-                text_color=self.colors['error']
-            ).pack(pady=20)
+        filename = os.path.basename(img_path)
+        if len(filename) > 25:
+            filename = filename[:22] + "..."
+        slot['name_label'].configure(text=filename)
 
-        return card
+        slot['del_btn'].configure(command=lambda: self.delete_image(img_path, item_idx))
 
     def delete_image(self, img_path, item_idx):
         """Delete an image from an item"""
         if 0 <= item_idx < len(self.items):
             item = self.items[item_idx]
-            if img_path in item['images']:
+            image_set = self._image_set(item)
+            if img_path in image_set:
                 if messagebox.askyesno("确认删除", f"确定要删除这张图片吗？\n{os.path.basename(img_path)}"):
                     item['images'].remove(img_path)
-                    self.refresh_item_list()
-                    self.display_item_images(item_idx)
-                    self.update_stats()
+                    image_set.discard(img_path)
+                    self._image_count_changed(len(item['images']) + 1, len(item['images']))
+                    self._request_redraw(item_idx, gallery=item_idx)
                     self.set_status("✓ 已删除图片")
 
+    def _image_set(self, item):
+        """Return the set mirroring item['images'], building it on first use
+
+        Kept under a '_' key so it is not written to project files; every
+        append to or removal from item['images'] must update it too.
+        """
+        image_set = item.get('_image_set')
+        if image_set is None:
+            image_set = item['_image_set'] = set(item['images'])
+        return image_set
+
+    def _request_redraw(self, *card_indices, gallery=None):
+        """Schedule a coalesced redraw after a change to item images
+
+        The given sidebar cards, the gallery for item `gallery` and the stats
+        are all updated once in a single idle callback, however many changes
+        were requested before it runs.
+        """
+        self._redraw_cards.update(card_indices)
+        if gallery is not None:
+            self._redraw_gallery = gallery
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        """Apply everything requested through _request_redraw"""
+        cards, self._redraw_cards = self._redraw_cards, set()
+        gallery, self._redraw_gallery = self._redraw_gallery, None
+        self._redraw_pending = False
+
+        if cards:
+            self.refresh_item_cards(*cards)
+        if gallery is not None and 0 <= gallery < len(self.items):
+            self.display_item_images(gallery)
+        self.update_stats()
+
     def clear_image_display(self):
         """Clear image gallery"""
-        for widget in self.image_gallery.winfo_children():
-            if widget != self.drop_zone:
-                widget.destroy()
+        # Forget placeholders; decodes still running for them are discarded
+        self._gallery_generation += 1
+        self._pending_thumbs.clear()
+        self._decoding_thumbs.clear()
+        for future in self._thumb_futures:
+            future.cancel()  # Only succeeds for decodes that have not started
+
+        # Hide the cards but keep them for the next display_item_images
+        for slot in self._image_slots:
+            slot['card'].grid_remove()
 
         # Show drop zone again
         if not self.drop_zone.winfo_viewable():
@@ -1353,18 +1782,38 @@ class ModernRepairTool(ctk.CTk):
     def update_stats(self):
         """Update statistics display"""
         total_items = len(self.items)
-        total_images = sum(len(item.get('images', [])) for item in self.items)
+        total_images = self._total_image_count
 
         self.stats_label.configure(text=f"{total_items} 项目 • {total_images} 图片")
 
         # Update max images per row
         if self.items:
-            self.max_images_per_row = max(len(item.get('images', [])) for item in self.items) or 1
+            self.max_images_per_row = max(self._image_count_hist, default=0) or 1
+
+    def _image_count_changed(self, old, new):
+        """Record an item's image count going from old to new
+
+        None stands for "no item", for items being added or removed.
+        """
+        hist = self._image_count_hist
+        if old is not None:
+            self._total_image_count -= old
+            hist[old] -= 1
+            if not hist[old]:
+                del hist[old]
+        if new is not None:
+            self._total_image_count += new
+            hist[new] += 1
+
+    def _rebuild_image_counts(self):
+        """Recount images from scratch after self.items is replaced"""
+        self._image_count_hist = Counter(len(item.get('images', [])) for item in self.items)
+        self._total_image_count = sum(n * c for n, c in self._image_count_hist.items())
 
     def set_status(self, message):
-        """Update status bar message"""
-        self.status_label.configure(text=message)
-        self.update_idletasks()
+        """Update status bar message; Tk repaints it on the next idle pass"""
+        if self.status_label.cget("text") != message:
+            self.status_label.configure(text=message)
 
     def _log_debug(self, message):
         """Add a debug log message with timestamp"""
@@ -1404,12 +1853,19 @@ class ModernRepairTool(ctk.CTk):
         btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
         btn_frame.pack(fill="x", padx=20, pady=5)
 
+        shown = [None]  # (count, last entry) currently in the text widget
+
         def refresh_logs():
             """Refresh the log display"""
+            snapshot = (len(self.debug_logs), self.debug_logs[-1] if self.debug_logs else None)
+            if snapshot == shown[0]:
+                return
+            shown[0] = snapshot
+
             text_widget.configure(state="normal")
             text_widget.delete("1.0", "end")
-            for log in self.debug_logs:
-                text_widget.insert("end", log + "\n")
+            if self.debug_logs:
+                text_widget.insert("end", "\n".join(self.debug_logs) + "\n")
             text_widget.configure(state="disabled")
             text_widget.see("end")
 
@@ -1450,15 +1906,22 @@ class ModernRepairTool(ctk.CTk):
         text_frame = ctk.CTkFrame(dialog)
         text_frame.pack(fill="both", expand=True, padx=20, pady=10)
 
-        text_widget = scrolledtext.ScrolledText(
+        text_widget = tk.Text(
             text_frame,
             wrap="word",
             font=("Courier", 10),
             bg=self.colors['bg_secondary'],
             fg=self.colors['text_primary'],
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
             state="disabled"
         )
-        text_widget.pack(fill="both", expand=True)
+        scrollbar = ctk.CTkScrollbar(text_frame, command=text_widget.yview)
+        text_widget.configure(yscrollcommand=scrollbar.set)
+
+        scrollbar.pack(side="right", fill="y")
+        text_widget.pack(side="left", fill="both", expand=True)
 
         # Initial load
         refresh_logs()
@@ -1508,6 +1971,7 @@ class ModernRepairTool(ctk.CTk):
 
     def save_project(self):
         """Save project to JSON file"""
+        self._commit_description()
         path = filedialog.asksaveasfilename(
             title="保存项目文件",
             defaultextension=".json",
@@ -1518,14 +1982,17 @@ class ModernRepairTool(ctk.CTk):
             try:
                 data = {
                     'title': self.project_title_var.get(),
-                    'items': self.items,
+                    'items': self._snapshot_items(),
                     'created_time': datetime.now().isoformat(),
                     'max_images_per_row': self.max_images_per_row,
                     'version': '2.0.0'
                 }
 
-                with open(path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                if ORJSON_AVAILABLE:
+                    Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(path, 'w', encoding='utf-8') as f:
+                        json.dump(data, f, indent=2, ensure_ascii=False)
 
                 self.set_status(f"✓ 项目已保存: {os.path.basename(path)}")
                 messagebox.showinfo("成功", "项目保存成功！")
@@ -1536,6 +2003,7 @@ class ModernRepairTool(ctk.CTk):
 
     def open_project(self):
         """Open project from JSON file"""
+        self._commit_description()
         path = filedialog.askopenfilename(
             title="打开项目文件",
             filetypes=[("JSON files", "*.json")]
@@ -1543,11 +2011,15 @@ class ModernRepairTool(ctk.CTk):
 
         if path:
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                if ORJSON_AVAILABLE:
+                    data = orjson.loads(Path(path).read_bytes())
+                else:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
 
                 self.project_title_var.set(data.get('title', ''))
                 self.items = data.get('items', [])
+                self._rebuild_image_counts()
                 self.max_images_per_row = data.get('max_images_per_row', 1)
                 self.current_item_id = max((item.get('id', 0) for item in self.items), default=0)
 
@@ -1564,6 +2036,7 @@ class ModernRepairTool(ctk.CTk):
 
     def export_excel(self):
         """Export to Excel (reuse original implementation)"""
+        self._commit_description()
         if not EXCEL_AVAILABLE:
             messagebox.showerror("错误", "Excel导出功能需要安装openpyxl库\n请运行: pip install openpyxl")
             return
@@ -1572,6 +2045,10 @@ class ModernRepairTool(ctk.CTk):
             messagebox.showwarning("警告", "没有数据可导出")
             return
 
+        if self._export_running:
+            messagebox.showwarning("警告", "已有导出任务正在进行，请等待完成后再试")
+            return
+
         title = self.project_title_var.get().strip()
         if not title:
             if not messagebox.askyesno("标题提醒", "您还没有设置项目标题！\n是否使用默认标题'维修检查报告'继续导出？"):
@@ -1586,119 +2063,175 @@ class ModernRepairTool(ctk.CTk):
         if path:
             self.set_status("正在导出Excel...")
             try:
-                self._export_excel_file(path)
+                self._start_export(self._export_excel_worker, path, "Excel", self.max_images_per_row)
             except Exception as e:
                 messagebox.showerror("错误", f"导出Excel失败: {str(e)}")
                 self.set_status("✗ Excel导出失败")
 
-    def _export_excel_file(self, file_path):
-        """Export to Excel file (original implementation)"""
-        try:
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "维修报告"
+    def _export_excel_worker(self, file_path, title, items, max_images_per_row, status_queue):
+        """Build the Excel file, streaming rows through a write-only workbook
 
-            title = self.project_title_var.get() or "维修检查报告"
+        Runs off the Tk main thread and reports through status_queue.
+        """
+        try:
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("维修报告")
 
-            # Title
-            title_cell = ws['A1']
-            title_cell.value = title
-            title_cell.font = Font(size=20, bold=True, name='微软雅黑')
-            title_cell.alignment = Alignment(horizontal='center', vertical='center')
+            total_cols = 2 + max_images_per_row
+            # Index 0 is unused so col_letters[n] is the letter of column n
+            col_letters = [None] + [get_column_letter(c) for c in range(1, total_cols + 1)]
+            end_col = col_letters[total_cols]
 
-            # Subtitle
-            subtitle_cell = ws['A2']
-            subtitle_cell.value = f"生成时间：{datetime.now().strftime('%Y年%m月%d日 %H:%M')}"
-            subtitle_cell.font = Font(size=11, italic=True, name='微软雅黑')
-            subtitle_cell.alignment = Alignment(horizontal='center')
+            # Column widths are written with the sheet header, so set them first
+            ws.column_dimensions['A'].width = 8
+            ws.column_dimensions['B'].width = 45
+            for i in range(max_images_per_row):
+                ws.column_dimensions[col_letters[3 + i]].width = 52
 
-            total_cols = 2 + self.max_images_per_row
-            end_col = chr(64 + total_cols)
-            ws.merge_cells(f'A1:{end_col}1')
-            ws.merge_cells(f'A2:{end_col}2')
+            # Table styles are registered once as named styles, so each cell
+            # takes a single style reference instead of four style lookups
+            thin = Border(left=Side(style='thin'), right=Side(style='thin'),
+                         top=Side(style='thin'), bottom=Side(style='thin'))
+            center = Alignment(horizontal='center', vertical='center')
+            for style in (
+                NamedStyle(name='repair_header', font=Font(bold=True, name='微软雅黑'), alignment=center,
+                           fill=PatternFill(start_color="E6E6FA", end_color="E6E6FA", fill_type="solid"),
+                           border=thin),
+                NamedStyle(name='repair_index', alignment=center, border=thin),
+                NamedStyle(name='repair_desc', font=Font(name='微软雅黑'),
+                           alignment=Alignment(horizontal='left', vertical='top', wrap_text=True),
+                           border=thin),
+                NamedStyle(name='repair_cell', border=thin),
+            ):
+                wb.add_named_style(style)
+
+            def make_cell(value=None, style=None, font=None, alignment=None):
+                c = WriteOnlyCell(ws, value=value)
+                if style:
+                    c.style = style
+                if font:
+                    c.font = font
+                if alignment:
+                    c.alignment = alignment
+                return c
+
+            # Title and subtitle
+            ws.append([make_cell(title, font=Font(size=20, bold=True, name='微软雅黑'), alignment=center)])
+            ws.append([make_cell(
+                f"生成时间：{datetime.now().strftime('%Y年%m月%d日 %H:%M')}",
+                font=Font(size=11, italic=True, name='微软雅黑'),
+                alignment=Alignment(horizontal='center')
+            )])
+            ws.merged_cells.add(f'A1:{end_col}1')
+            ws.merged_cells.add(f'A2:{end_col}2')
+            ws.append([])
 
             # Headers
-            headers = ['序号', '维修内容描述'] + [f'图片{i+1}' for i in range(self.max_images_per_row)]
-            for col, header in enumerate(headers, 1):
-                c = ws.cell(row=4, column=col)
-                c.value = header
-                c.font = Font(bold=True, name='微软雅黑')
-                c.alignment = Alignment(horizontal='center', vertical='center')
-                c.fill = PatternFill(start_color="E6E6FA", end_color="E6E6FA", fill_type="solid")
+            headers = ['序号', '维修内容描述'] + [f'图片{i+1}' for i in range(max_images_per_row)]
+            ws.append([make_cell(h, style='repair_header') for h in headers])
 
-            # Data rows
-            temp_files = []
-            for row_idx, item in enumerate(self.items, 5):
-                ws.cell(row=row_idx, column=1).value = row_idx - 4
-                ws.cell(row=row_idx, column=1).alignment = Alignment(horizontal='center', vertical='center')
+            # Shrink every embedded image up front on a thread pool
+            paths = list(dict.fromkeys(p for item in items for p in item['images'][:max_images_per_row]))
+            stat_cache = self._stat_image_paths(paths)
 
-                desc_cell = ws.cell(row=row_idx, column=2)
-                desc_cell.value = item['description']
-                desc_cell.alignment = Alignment(horizontal='left', vertical='top', wrap_text=True)
-                desc_cell.font = Font(name='微软雅黑')
+            def shrink(img_path):
+                if img_path not in stat_cache or self._export_stop.is_set():
+                    return None
+                try:
+                    buf, new_w, new_h = self._shrink_for_xlsx(img_path)
+                    return buf.getvalue(), new_w, new_h
+                except Exception as e:
+                    return e
 
-                images = item.get('images', [])
+            shrunk = {}
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as pool:
+                for n, (img_path, result) in enumerate(zip(paths, pool.map(shrink, paths)), 1):
+                    if self._export_stop.is_set():
+                        pool.shutdown(cancel_futures=True)
+                        return
+                    shrunk[img_path] = result
+                    status_queue.put(('status', f"正在处理图片... ({n}/{len(paths)})"))
+
+            # Data rows
+            status_queue.put(('status', "正在生成Excel..."))
+            for row_idx, item in enumerate(items, 5):
+                row = [
+                    make_cell(row_idx - 4, style='repair_index'),
+                    make_cell(item['description'], style='repair_desc'),
+                ] + [make_cell(style='repair_cell') for _ in range(max_images_per_row)]
+
+                images = item['images']
                 row_max_height = 40
 
-                for img_idx, img_path in enumerate(images[:self.max_images_per_row]):
+                for img_idx, img_path in enumerate(images[:max_images_per_row]):
                     col = 3 + img_idx
                     try:
-                        if not os.path.exists(img_path):
-                            ws.cell(row=row_idx, column=col).value = f"图片文件不存在:\n{os.path.basename(img_path)}"
+                        result = shrunk[img_path]
+                        if result is None:
+                            row[col - 1].value = f"图片文件不存在:\n{os.path.basename(img_path)}"
                             continue
+                        if isinstance(result, Exception):
+                            raise result
 
-                        with Image.open(img_path) as img:
-                            target_w, target_h = 1200, 900
-                            r = img.width / img.height
-                            if r > target_w/target_h:
-                                new_w, new_h = target_w, int(target_w / r)
-                            else:
-                                new_h, new_w = target_h, int(target_h * r)
-
-                            processed = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-                            tpath = os.path.join(tempfile.gettempdir(), f"excel_img_{uuid.uuid4().hex}.png")
-                            processed.save(tpath, 'PNG')
-
-                        temp_files.append(tpath)
-                        excel_img = xl_image.Image(tpath)
+                        # openpyxl closes the stream on save, so each use gets its own
+                        data, new_w, new_h = result
+                        excel_img = xl_image.Image(io.BytesIO(data))
                         scale = 0.32
                         excel_img.width = new_w * scale
                         excel_img.height = new_h * scale
-                        ws.add_image(excel_img, f'{chr(64 + col)}{row_idx}')
+                        ws.add_image(excel_img, f'{col_letters[col]}{row_idx}')
                         row_max_height = max(row_max_height, new_h * scale * 0.8)
 
                     except Exception as e:
-                        ws.cell(row=row_idx, column=col).value = f"图片处理失败:\n{os.path.basename(img_path)}"
+                        row[col - 1].value = f"图片处理失败:\n{os.path.basename(img_path)}"
 
+                # Row height must be known before the row is streamed out
                 ws.row_dimensions[row_idx].height = row_max_height
+                ws.append(row)
 
-            # Column widths
-            ws.column_dimensions['A'].width = 8
-            ws.column_dimensions['B'].width = 45
-            for i in range(self.max_images_per_row):
-                ws.column_dimensions[chr(67+i)].width = 52
-
-            # Borders
-            thin = Border(left=Side(style='thin'), right=Side(style='thin'),
-                         top=Side(style='thin'), bottom=Side(style='thin'))
-            for row in range(4, len(self.items)+5):
-                for col in range(1, total_cols+1):
-                    ws.cell(row=row, column=col).border = thin
-
+            status_queue.put(('status', "正在保存Excel..."))
             wb.save(file_path)
+            status_queue.put(('done', file_path))
 
-            # Cleanup temp files after delay
-            self.after(5000, lambda: self._cleanup_temp_files(temp_files))
+        except Exception as e:
+            status_queue.put(('error', str(e)))
 
-            self.set_status(f"✓ Excel文件已保存: {os.path.basename(file_path)}")
-            messagebox.showinfo("成功", f"Excel文件已保存到:\n{file_path}")
+    def _shrink_for_xlsx(self, img_path, target_w=1200, target_h=900):
+        """Resize an image for embedding in Excel and encode it in memory
 
-        except Exception as e:
-            messagebox.showerror("错误", f"导出Excel失败: {str(e)}")
-            self.set_status("✗ Excel导出失败")
+        Returns (BytesIO, width, height). Photos become JPEG; images with
+        transparency stay PNG so their alpha channel survives.
+        """
+        with Image.open(img_path) as img:
+            r = img.width / img.height
+            if r > target_w/target_h:
+                new_w, new_h = target_w, int(target_w / r)
+            else:
+                new_h, new_w = target_h, int(target_h * r)
+
+            # Decode JPEGs at a reduced DCT scale, then box-reduce before the
+            # Lanczos pass. thumbnail() never upscales; small images keep their
+            # pixels and are still displayed at new_w x new_h.
+            img.draft('RGB', (new_w, new_h))
+            img.thumbnail((new_w, new_h), Image.Resampling.LANCZOS, reducing_gap=2.0)
+            # thumbnail() skips loading when no shrink is needed; read the
+            # pixels before the file is closed
+            img.load()
+            processed = img
+
+        buf = io.BytesIO()
+        if processed.mode in ('RGBA', 'LA') or 'transparency' in processed.info:
+            processed.save(buf, 'PNG')
+        else:
+            if processed.mode != 'RGB':
+                processed = processed.convert('RGB')
+            processed.save(buf, 'JPEG', quality=80, optimize=False, progressive=False)
+        buf.seek(0)
+        return buf, new_w, new_h
 
     def export_pdf(self):
         """Export to PDF (reuse original implementation)"""
+        self._commit_description()
         if not PDF_AVAILABLE:
             messagebox.showerror("错误", "PDF导出功能需要安装reportlab库\n请运行: pip install reportlab")
             return
@@ -1707,6 +2240,10 @@ class ModernRepairTool(ctk.CTk):
             messagebox.showwarning("警告", "没有数据可导出")
             return
 
+        if self._export_running:
+            messagebox.showwarning("警告", "已有导出任务正在进行，请等待完成后再试")
+            return
+
         title = self.project_title_var.get().strip()
         if not title:
             if not messagebox.askyesno("标题提醒", "您还没有设置项目标题！\n是否使用默认标题'维修检查报告'继续导出？"):
@@ -1721,18 +2258,73 @@ class ModernRepairTool(ctk.CTk):
         if path:
             self.set_status("正在导出PDF...")
             try:
-                self._export_pdf_file(path)
+                self._start_export(self._export_pdf_worker, path, "PDF")
             except Exception as e:
                 messagebox.showerror("错误", f"导出PDF失败: {str(e)}")
                 self.set_status("✗ PDF导出失败")
 
-    def _export_pdf_file(self, file_path):
-        """Export to PDF file (original implementation)"""
+    def _start_export(self, worker, file_path, label, *extra_args):
+        """Run an export worker on a background thread and poll its progress
+
+        The worker is called as worker(file_path, title, items, *extra_args,
+        status_queue) and must not touch Tk objects.
+        """
+        title = self.project_title_var.get() or "维修检查报告"
+        status_queue = queue.Queue()
+        threading.Thread(
+            target=worker,
+            args=(file_path, title, self._snapshot_items(), *extra_args, status_queue),
+            daemon=True
+        ).start()
+        self._export_running = True
+        self._poll_export_queue(status_queue, label)
+
+    def _snapshot_items(self):
+        """Copy the items for use off the Tk thread or on disk
+
+        Runtime bookkeeping under '_' keys (e.g. '_image_set') is left out.
+        """
+        snapshot = []
+        for item in self.items:
+            copy = {k: v for k, v in item.items() if not k.startswith('_')}
+            copy['images'] = list(item.get('images', []))
+            snapshot.append(copy)
+        return snapshot
+
+    def _poll_export_queue(self, status_queue, label):
+        """Apply export worker messages on the Tk main thread"""
+        status = None
         try:
-            self._setup_chinese_fonts()
+            while True:
+                kind, payload = status_queue.get_nowait()
+                if kind == 'status':
+                    status = payload  # Only the latest progress message is shown
+                elif kind == 'done':
+                    self._export_running = False
+                    self.set_status(f"✓ {label}文件已保存: {os.path.basename(payload)}")
+                    messagebox.showinfo("成功", f"{label}文件已保存到:\n{payload}")
+                    return
+                elif kind == 'error':
+                    self._export_running = False
+                    messagebox.showerror("错误", f"导出{label}失败: {payload}")
+                    self.set_status(f"✗ {label}导出失败")
+                    return
+        except queue.Empty:
+            pass
+        if status is not None:
+            self.set_status(status)
+        self.after(100, self._poll_export_queue, status_queue, label)
 
+    def _export_pdf_worker(self, file_path, title, items, status_queue):
+        """Build the PDF file (runs off the Tk main thread)"""
+        try:
+            font_name = self._setup_chinese_fonts()
+
+            # Render into memory, then write once and swap into place so a
+            # failed export never leaves a half-written PDF behind
+            buf = io.BytesIO()
             doc = SimpleDocTemplate(
-                file_path,
+                buf,
                 pagesize=A4,
                 topMargin=20*mm,
                 bottomMargin=20*mm,
@@ -1747,7 +2339,7 @@ class ModernRepairTool(ctk.CTk):
                 chinese = ParagraphStyle(
                     'Chinese',
                     parent=styles['Normal'],
-                    fontName='Chinese',
+                    fontName=font_name,
                     fontSize=10,
                     leading=12,
                     wordWrap='CJK'
@@ -1755,7 +2347,7 @@ class ModernRepairTool(ctk.CTk):
                 title_style = ParagraphStyle(
                     'ChineseTitle',
                     parent=styles['Heading1'],
-                    fontName='Chinese',
+                    fontName=font_name,
                     fontSize=20,
                     spaceAfter=20,
                     alignment=TA_CENTER,
@@ -1773,7 +2365,6 @@ class ModernRepairTool(ctk.CTk):
                 title_style = styles['Heading1']
                 subtitle_style = styles['Normal']
 
-            title = self.project_title_var.get() or "维修检查报告"
             story.append(Paragraph(title, title_style))
             story.append(Paragraph(
                 f"生成时间：{datetime.now().strftime('%Y年%m月%d日 %H:%M')}",
@@ -1782,26 +2373,29 @@ class ModernRepairTool(ctk.CTk):
             story.append(Spacer(1, 30))
 
             # Add items
-            temp_files = []
-            for idx, item in enumerate(self.items):
-                title_para = Paragraph(
-                    f"{idx+1}. {item['description']}",
-                    ParagraphStyle(
-                        'ItemTitle',
-                        parent=chinese,
-                        fontSize=12,
-                        fontName='Chinese',
-                        spaceBefore=10,
-                        spaceAfter=10,
-                        leftIndent=0,
-                        leading=14
-                    )
-                )
+            item_title_style = ParagraphStyle(
+                'ItemTitle',
+                parent=chinese,
+                fontSize=12,
+                fontName=font_name,
+                spaceBefore=10,
+                spaceAfter=10,
+                leftIndent=0,
+                leading=14
+            )
+            stat_cache = self._stat_image_paths(p for item in items for p in item['images'])
+            prepared = self._prepare_pdf_images(items, stat_cache, status_queue)
+            if prepared is None:
+                return  # Window closed
+
+            status_queue.put(('status', "正在生成PDF..."))
+            for idx, item in enumerate(items):
+                title_para = Paragraph(f"{idx+1}. {item['description']}", item_title_style)
                 story.append(title_para)
 
                 images = item.get('images', [])
                 if images:
-                    img_element = self._create_pdf_images(images, temp_files)
+                    img_element = self._create_pdf_images(images, prepared)
                     if img_element:
                         story.append(img_element)
                     else:
@@ -1809,23 +2403,52 @@ class ModernRepairTool(ctk.CTk):
                 else:
                     story.append(Paragraph("暂无图片", chinese))
 
-                if idx < len(self.items) - 1:
+                if idx < len(items) - 1:
                     story.append(Spacer(1, 20))
 
+            # build() consumes the story as it goes; lazy=2 images drop their
+            # decoded data right after being drawn, so memory doesn't pile up
             doc.build(story)
 
-            # Cleanup
-            self.after(5000, lambda: self._cleanup_temp_files(temp_files))
+            tmp_path = file_path + ".tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(buf.getbuffer())
+                os.replace(tmp_path, file_path)
+            except Exception:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+            self._prune_image_cache(PDF_IMAGE_CACHE_DIR, PDF_IMAGE_CACHE_MAX_BYTES)
 
-            self.set_status(f"✓ PDF文件已保存: {os.path.basename(file_path)}")
-            messagebox.showinfo("成功", f"PDF文件已保存到:\n{file_path}")
+            status_queue.put(('done', file_path))
 
         except Exception as e:
-            messagebox.showerror("错误", f"导出PDF失败: {str(e)}")
-            self.set_status("✗ PDF导出失败")
+            status_queue.put(('error', str(e)))
 
     def _setup_chinese_fonts(self):
-        """Setup Chinese fonts for PDF"""
+        """Setup Chinese fonts for PDF and return the font name to use
+
+        The built-in STSong-Light CID font is referenced rather than embedded,
+        so there is no TTF parsing or subsetting; system TTFs are the fallback.
+        Registration happens once; later calls return the cached name.
+        """
+        with self._pdf_font_lock:
+            if self._pdf_font_name is None:
+                self._pdf_font_name = self._register_chinese_font()
+            return self._pdf_font_name
+
+    def _register_chinese_font(self):
+        """Register a Chinese-capable font with ReportLab and return its name"""
+        try:
+            pdfmetrics.registerFont(UnicodeCIDFont('STSong-Light'))
+            return 'STSong-Light'
+        except Exception:
+            pass
+
         try:
             system = platform.system()
             if system == "Windows":
@@ -1838,88 +2461,225 @@ class ModernRepairTool(ctk.CTk):
             for p in paths:
                 if os.path.exists(p):
                     pdfmetrics.registerFont(TTFont('Chinese', p))
-                    return
+                    return 'Chinese'
 
             pdfmetrics.registerFont(TTFont('Chinese', 'Helvetica'))
         except:
             pass
-
-    def _create_pdf_images(self, images, temp_files):
-        """Create PDF image layout"""
+        return 'Chinese'
+
+    def _pdf_image_box(self, count):
+        """Return the (max_width, max_height) box for images of an item with count images"""
+        if count == 1:
+            return 150*mm, 100*mm
+        size = 70*mm if count <= 4 else 50*mm
+        return size, size
+
+    def _prepare_pdf_images(self, items, stat_cache, status_queue):
+        """Process every report image once, before the PDF is laid out
+
+        Returns a dict of (path, max_width, max_height) -> _process_pdf_image
+        result (None for missing or failed images). Results with identical
+        JPEG bytes share one file, and ReportLab embeds each file only once,
+        so a picture used several times ends up in the PDF once. Returns
+        None if the window was closed while images were being processed.
+        """
+        keys = []
+        for item in items:
+            max_w, max_h = self._pdf_image_box(len(item['images']))
+            keys.extend((p, max_w, max_h) for p in item['images'])
+        keys = list(dict.fromkeys(keys))
+
+        def process(key):
+            p, max_w, max_h = key
+            if p not in stat_cache or self._export_stop.is_set():
+                return None
+            return self._process_pdf_image(p, max_w, max_h, stat_cache[p])
+
+        # Images are independent, so process them on a thread pool
+        prepared = {}
+        by_digest = {}
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as pool:
+            for n, (key, result) in enumerate(zip(keys, pool.map(process, keys)), 1):
+                if self._export_stop.is_set():
+                    pool.shutdown(cancel_futures=True)
+                    return None
+                status_queue.put(('status', f"正在处理图片... ({n}/{len(keys)})"))
+                if result:
+                    try:
+                        with open(result[0], 'rb') as f:
+                            digest = hashlib.blake2b(f.read()).digest()
+                        result = (by_digest.setdefault(digest, result[0]),) + result[1:]
+                    except OSError:
+                        pass
+                prepared[key] = result
+        return prepared
+
+    def _create_pdf_images(self, images, prepared):
+        """Create PDF image layout from _prepare_pdf_images results"""
         try:
+            max_w, max_h = self._pdf_image_box(len(images))
+            processed = [prepared.get((p, max_w, max_h)) for p in images]
             if len(images) == 1:
-                p = images[0]
-                if os.path.exists(p):
-                    t = self._process_pdf_image(p, temp_files, 150*mm, 100*mm)
-                    if t:
-                        img = RL_Image(t, width=150*mm, height=100*mm, kind='proportional')
-                        table = Table([[img]], colWidths=[170*mm])
-                        table.setStyle(TableStyle([('ALIGN', (0,0), (-1,-1), 'CENTER')]))
-                        return table
+                t = processed[0]
+                if t:
+                    path, w, h = t
+                    img = RL_Image(path, width=w, height=h, lazy=2)
+                    table = Table([[img]], colWidths=[170*mm])
+                    table.setStyle(PDF_CENTER_STYLE)
+                    return table
             else:
                 cols = 2 if len(images) <= 4 else 3
-                rows, row = [], []
-                for i, p in enumerate(images):
-                    if os.path.exists(p):
-                        size = 70*mm if cols==2 else 50*mm
-                        t = self._process_pdf_image(p, temp_files, size, size)
-                        row.append(RL_Image(t, width=size, height=size, kind='proportional') if t else "")
-                    else:
-                        row.append("")
-
-                    if len(row) >= cols or i == len(images)-1:
-                        while len(row) < cols:
-                            row.append("")
-                        rows.append(row)
-                        row = []
+                cells = [RL_Image(t[0], width=t[1], height=t[2], lazy=2) if t else "" for t in processed]
+                cells += [""] * (-len(cells) % cols)  # Pad the last row
+                rows = [cells[i:i+cols] for i in range(0, len(cells), cols)]
 
                 if rows:
                     col_w = 85*mm if cols==2 else 56*mm
                     table = Table(rows, colWidths=[col_w]*cols)
-                    table.setStyle(TableStyle([
-                        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-                        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                        ('LEFTPADDING', (0,0), (-1,-1), 5),
-                        ('RIGHTPADDING', (0,0), (-1,-1), 5),
-                        ('TOPPADDING', (0,0), (-1,-1), 5),
-                        ('BOTTOMPADDING', (0,0), (-1,-1), 5),
-                    ]))
+                    table.setStyle(PDF_IMAGE_GRID_STYLE)
                     return table
         except:
             pass
         return None
 
-    def _process_pdf_image(self, img_path, temp_files, max_width, max_height):
-        """Process image for PDF"""
-        try:
-            with Image.open(img_path) as img:
-                max_w_px, max_h_px = int(max_width*10), int(max_height*10)
-                r = img.width / img.height
-                if img.width/max_w_px > img.height/max_h_px:
-                    new_w, new_h = max_w_px, int(max_w_px / r)
-                else:
-                    new_h, new_w = max_h_px, int(max_h_px * r)
-
-                resized = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-                if resized.mode != 'RGB':
-                    resized = resized.convert('RGB')
+    def _process_pdf_image(self, img_path, max_width, max_height, st):
+        """Process image for PDF, reusing a cached copy when available
 
-                t = os.path.join(tempfile.gettempdir(), f"pdf_img_{uuid.uuid4().hex}.jpg")
-                resized.save(t, 'JPEG', quality=92)
-                temp_files.append(t)
-                return t
+        Returns (path, width, height) with the exact drawing size in points,
+        so ReportLab doesn't have to measure the image again, or None.
+        """
+        try:
+            max_w_px, max_h_px = int(max_width*10), int(max_height*10)
+            cache_path = self._cache_path(
+                PDF_IMAGE_CACHE_DIR, os.path.abspath(img_path), st.st_mtime_ns,
+                f"{max_w_px}x{max_h_px}", RESAMPLE_FILTER, f"q{PDF_JPEG_QUALITY}"
+            )
+            if os.path.exists(cache_path):
+                os.utime(cache_path)  # Mark as recently used for eviction
+                size = self.pdf_image_sizes.get(cache_path)
+                if size is None:
+                    with Image.open(cache_path, formats=('JPEG',)) as cached:
+                        size = cached.size  # Header only, no decode
+                    self.pdf_image_sizes[cache_path] = size
+                return (cache_path,) + self._fit_pdf_size(size, max_width, max_height)
+
+            with Image.open(img_path, formats=IMAGE_FORMATS) as img:
+                # Small JPEG/PNG files (e.g. screenshots) can be embedded as they are
+                if (img.width <= max_w_px and img.height <= max_h_px
+                        and img.mode in ('RGB', 'L') and img.format in ('JPEG', 'PNG')):
+                    return (img_path,) + self._fit_pdf_size(img.size, max_width, max_height)
+
+                # Let libjpeg decode at 1/2, 1/4 or 1/8 scale (no-op for other formats)
+                try:
+                    img.draft('RGB', (max_w_px, max_h_px))
+                except Exception:
+                    pass
+                img.thumbnail((max_w_px, max_h_px), RESAMPLE_FILTER, reducing_gap=2.0)
+                resized = img if img.mode == 'RGB' else img.convert('RGB')
+
+                if not self._atomic_write(cache_path, lambda t: resized.save(
+                        t, 'JPEG', quality=PDF_JPEG_QUALITY,
+                        optimize=False, progressive=False, subsampling=2)):
+                    return None
+                self.pdf_image_sizes[cache_path] = resized.size
+                return (cache_path,) + self._fit_pdf_size(resized.size, max_width, max_height)
         except:
             return None
 
-    def _cleanup_temp_files(self, files):
-        """Cleanup temporary files"""
-        for f in files:
+    def _fit_pdf_size(self, size, max_width, max_height):
+        """Scale a pixel size to fill the given box while keeping aspect ratio"""
+        r = size[0] / size[1]
+        if r > max_width / max_height:
+            return max_width, max_width / r
+        return max_height * r, max_height
+
+    def _stat_image_paths(self, paths):
+        """Stat image paths with one directory scan per folder
+
+        Returns a dict of path -> os.stat_result for the files that exist.
+        """
+        by_dir = {}
+        for p in paths:
+            by_dir.setdefault(os.path.dirname(p), {}).setdefault(os.path.basename(p), []).append(p)
+
+        stats = {}
+        for d, names in by_dir.items():
             try:
-                if os.path.exists(f):
-                    os.unlink(f)
-            except:
+                with os.scandir(d or '.') as it:
+                    for entry in it:
+                        if entry.name in names:
+                            st = entry.stat()  # Free on Windows, taken from the listing
+                            for p in names[entry.name]:
+                                stats[p] = st
+            except OSError:
                 pass
 
+            # Fall back to a direct stat for anything the listing didn't match
+            # (e.g. different letter case on case-insensitive filesystems)
+            for name_paths in names.values():
+                for p in name_paths:
+                    if p not in stats:
+                        try:
+                            stats[p] = os.stat(p)
+                        except OSError:
+                            pass
+        return stats
+
+    def _cache_path(self, cache_dir, *key_parts):
+        """Return the cache file in cache_dir for the given key parts
+
+        Callers include the source path and mtime so an edited file misses.
+        """
+        key = "|".join(f"{part}" for part in key_parts)
+        digest = hashlib.blake2b(key.encode('utf-8', 'surrogateescape')).hexdigest()[:32]
+        return os.path.join(cache_dir, f"{digest}.jpg")
+
+    def _atomic_write(self, path, writer):
+        """Write a cache file through a temp name and swap it into place
+
+        writer is called with the temp path, so a crash never leaves a
+        truncated entry. Failures are logged and the temp file removed.
+        Returns True if the file was written.
+        """
+        t = f"{path}.{os.getpid()}_{next(self._tmp_counter)}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            writer(t)
+            os.replace(t, path)
+            return True
+        except Exception as e:
+            self._log_debug(f"Cache write failed for {path}: {e}")
+            try:
+                os.unlink(t)
+            except OSError:
+                pass
+            return False
+
+    def _prune_image_cache(self, cache_dir, max_bytes):
+        """Evict least recently used cache entries beyond the size limit"""
+        try:
+            entries = []
+            total = 0
+            with os.scandir(cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.jpg') and entry.is_file():
+                        st = entry.stat()
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+                        total += st.st_size
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= max_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                    total -= size
+                except OSError:
+                    pass
+        except OSError:
+            pass
+
     def create_menu(self):
         """Create menu bar with all options"""
         menubar = tk.Menu(self)
@@ -1937,7 +2697,7 @@ class ModernRepairTool(ctk.CTk):
         if PDF_AVAILABLE:
             file_menu.add_command(label="导出PDF", command=self.export_pdf, accelerator="Ctrl+P")
         file_menu.add_separator()
-        file_menu.add_command(label="退出", command=self.quit)
+        file_menu.add_command(label="退出", command=self.on_closing)
 
         # Edit menu
         edit_menu = tk.Menu(menubar, tearoff=0)
@@ -1976,8 +2736,10 @@ class ModernRepairTool(ctk.CTk):
 
     def new_project(self):
         """Create new project"""
+        self._commit_description()
         if self.items and messagebox.askyesno("确认", "当前项目未保存，确定要新建项目吗？"):
             self.items = []
+            self._rebuild_image_counts()
             self.current_item_id = 0
             self.project_title_var.set("")
             self.selected_item_index = None
@@ -1985,6 +2747,7 @@ class ModernRepairTool(ctk.CTk):
             self.clear_image_display()
             self.description_entry.delete(0, "end")
             self.thumbnail_cache.clear()
+            self._thumbnail_keys.clear()
             self.update_stats()
             self.set_status("✓ 已创建新项目")
         elif not self.items:
@@ -2008,6 +2771,7 @@ class ModernRepairTool(ctk.CTk):
 
     def preview_report(self):
         """Preview report content"""
+        self._commit_description()
         if not self.items:
             messagebox.showwarning("警告", "没有数据可预览")
             return
@@ -2034,33 +2798,124 @@ class ModernRepairTool(ctk.CTk):
         scrollbar.pack(side="right", fill="y")
         text.pack(side="left", fill="both", expand=True)
 
-        # Generate content
+        text.insert("1.0", "正在读取图片信息...\n")
+        text.config(state="disabled")
+
+        # Image headers are read on a worker thread so the dialog opens at once;
+        # the worker gets a snapshot and must not touch Tk objects
         title = self.project_title_var.get() or "维修检查报告"
-        content = f"{'='*60}\n{title:^60}\n{'='*60}\n\n"
-        content += f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        content += f"项目总数: {len(self.items)}\n"
-        content += f"图片总数: {sum(len(it.get('images',[])) for it in self.items)}\n"
-        content += f"工具版本: v2.0.0 Modern Edition\n\n"
-
-        for i, item in enumerate(self.items):
-            content += f"{'-'*60}\n项目 {i+1}: {item['description']}\n{'-'*60}\n"
-            imgs = item.get('images', [])
+        items = self._snapshot_items()
+        total_images = self._total_image_count
+        result_queue = queue.Queue()
+        threading.Thread(
+            target=lambda: result_queue.put(self._build_preview_text(title, items, total_images)),
+            daemon=True
+        ).start()
+
+        def show_content():
+            if not dialog.winfo_exists():
+                return
+            try:
+                content = result_queue.get_nowait()
+            except queue.Empty:
+                dialog.after(50, show_content)
+                return
+            text.config(state="normal")
+            text.delete("1.0", "end")
+            text.insert("1.0", content)
+            text.config(state="disabled")
+
+        show_content()
+
+    def _build_preview_text(self, title, items, total_images):
+        """Build the preview report text (runs off the Tk main thread)"""
+        parts = [
+            f"{'='*60}\n{title:^60}\n{'='*60}\n\n",
+            f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"项目总数: {len(items)}\n",
+            f"图片总数: {total_images}\n",
+            f"工具版本: v2.0.0 Modern Edition\n\n",
+        ]
+
+        # One directory scan per folder instead of a stat per image
+        stat_cache = self._stat_image_paths(p for item in items for p in item['images'])
+
+        for i, item in enumerate(items):
+            parts.append(f"{'-'*60}\n项目 {i+1}: {item['description']}\n{'-'*60}\n")
+            imgs = item['images']
             if imgs:
-                content += f"包含图片 ({len(imgs)} 张):\n"
+                parts.append(f"包含图片 ({len(imgs)} 张):\n")
                 for j, p in enumerate(imgs):
                     try:
-                        size_k = os.path.getsize(p)/1024
-                        with Image.open(p) as im:
-                            info = f"{im.width}×{im.height}"
-                        content += f"  {j+1}. {os.path.basename(p)} ({size_k:.1f}KB, {info})\n"
+                        w, h, size = self._get_image_info(p, stat_cache[p])
+                        parts.append(f"  {j+1}. {os.path.basename(p)} ({size/1024:.1f}KB, {w}×{h})\n")
                     except:
-                        content += f"  {j+1}. {os.path.basename(p)} (无法读取信息)\n"
+                        parts.append(f"  {j+1}. {os.path.basename(p)} (无法读取信息)\n")
             else:
-                content += "暂无图片\n"
-            content += "\n"
+                parts.append("暂无图片\n")
+            parts.append("\n")
 
-        text.insert("1.0", content)
-        text.config(state="disabled")
+        return "".join(parts)
+
+    def _get_image_info(self, path, st=None):
+        """Return (width, height, file size) for an image, cached by mtime
+
+        st is the file's stat result, if the caller already has it.
+        """
+        if st is None:
+            st = os.stat(path)
+        key = (path, st.st_mtime_ns)
+        info = self.image_info_cache.get(key)
+        if info is None:
+            dims = self._fast_image_size(path)
+            if dims is None:
+                with Image.open(path, formats=IMAGE_FORMATS) as im:
+                    dims = im.size  # Header only, no decode
+            info = (dims[0], dims[1], st.st_size)
+            self.image_info_cache[key] = info
+        return info
+
+    def _fast_image_size(self, path):
+        """Read JPEG/PNG dimensions straight from the file header
+
+        Returns (width, height), or None if the format isn't recognised.
+        """
+        with open(path, 'rb') as f:
+            head = f.read(24)
+            if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+                return struct.unpack('>II', head[16:24])
+
+            if head[:2] != b'\xff\xd8':
+                return None
+
+            # Walk JPEG segments until a SOFn marker; EXIF thumbnails live
+            # inside APP1 and are skipped as a whole, so they can't be hit
+            f.seek(2)
+            while True:
+                byte = f.read(1)
+                while byte and byte != b'\xff':
+                    byte = f.read(1)
+                while byte == b'\xff':
+                    byte = f.read(1)
+                if not byte:
+                    return None
+
+                marker = byte[0]
+                if marker in (0x01, 0xd0, 0xd1, 0xd2, 0xd3, 0xd4, 0xd5, 0xd6, 0xd7):
+                    continue  # Standalone markers carry no length
+                seg = f.read(2)
+                if len(seg) < 2:
+                    return None
+                length = struct.unpack('>H', seg)[0]
+                if length < 2:
+                    return None
+                if 0xc0 <= marker <= 0xcf and marker not in (0xc4, 0xc8, 0xcc):
+                    sof = f.read(5)
+                    if len(sof) < 5:
+                        return None
+                    h, w = struct.unpack('>HH', sof[1:5])
+                    return w, h
+                f.seek(length - 2, os.SEEK_CUR)
 
     def show_help(self):
         """Show help dialog"""
@@ -2274,6 +3129,7 @@ PDF：{'✅ 可用' if PDF_AVAILABLE else '❌ 不可用'}
 
     def move_item_up(self):
         """Move selected item up"""
+        self._commit_description()
         if self.selected_item_index is None:
             messagebox.showwarning("提示", "请先选择一个项目")
             return
@@ -2282,13 +3138,14 @@ PDF：{'✅ 可用' if PDF_AVAILABLE else '❌ 不可用'}
         if idx > 0:
             self.items[idx], self.items[idx-1] = self.items[idx-1], self.items[idx]
             self.selected_item_index = idx - 1
-            self.refresh_item_list()
+            self.refresh_item_cards(idx, idx - 1)
             self.set_status("✓ 项目已上移")
         else:
             self.set_status("已经是第一个项目")
 
     def move_item_down(self):
         """Move selected item down"""
+        self._commit_description()
         if self.selected_item_index is None:
             messagebox.showwarning("提示", "请先选择一个项目")
             return
@@ -2297,7 +3154,7 @@ PDF：{'✅ 可用' if PDF_AVAILABLE else '❌ 不可用'}
         if idx < len(self.items) - 1:
             self.items[idx], self.items[idx+1] = self.items[idx+1], self.items[idx]
             self.selected_item_index = idx + 1
-            self.refresh_item_list()
+            self.refresh_item_cards(idx, idx + 1)
             self.set_status("✓ 项目已下移")
         else:
             self.set_status("已经是最后一个项目")